@@ -23,8 +23,10 @@ from .internals.interfaces import (
 )
 from .path_utils import (
     to_win32_path,
+    to_win32_paths,
     to_platform_path,
     normalize_path,
+    clear_normalize_path_cache,
     is_absolute,
     get_relative_path
 )
@@ -56,8 +58,10 @@ __all__ = [
     'WorkflowCommand',
     'WorkflowEnv',
     'to_win32_path',
+    'to_win32_paths',
     'to_platform_path',
     'normalize_path',
+    'clear_normalize_path_cache',
     'is_absolute',
     'get_relative_path',
     'SummaryWriter',
@@ -4,8 +4,10 @@
 Functions related to retrieving action inputs
 
 '''
+from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
 from .internals.exceptions import InputError
 from .internals.utils import (
@@ -14,17 +16,52 @@ from .internals.utils import (
     split_lines
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 __all__ = [
     'get_input',
     'get_multiline_input',
     'get_bool_input'
 ]
 
+def _split_multiline(
+    raw: str,
+    *,
+    skip_empty: bool = True,
+    trim: bool = True
+) -> list[str]:
+    '''
+    Split a raw multiline input value into its lines.
+
+    Parameters
+    ----------
+    raw : str
+        The raw input value.
+    skip_empty : bool
+        Whether to filter out empty lines. Default is True.
+    trim : bool
+        Whether to strip whitespace from each line. Default is True.
+
+    Returns
+    -------
+    list[str]
+        The processed lines.
+    '''
+    lines = split_lines(raw, skip_empty=skip_empty)
+
+    if trim:
+        lines = list(map(str.strip, lines))
+
+    return lines
+
+
 def get_input(
     name: str,
     *,
     required: bool = False,
-    trim_whitespace: bool = True
+    trim_whitespace: bool = True,
+    env: Mapping[str, str] | None = None
 ) -> str:
     '''
     Get the value of an action input.
@@ -40,6 +77,8 @@ def get_input(
         Options for retrieving the input:
         - required: Whether the input is required (raises if missing)
         - trimWhitespace: Whether to trim whitespace (default: True)
+    env : Mapping[str, str] | None
+        Mapping to read the input from. Defaults to os.environ.
 
     Returns
     -------
@@ -68,8 +107,11 @@ def get_input(
     ...     options=InputOptions(trimWhitespace=False)
     ... )
     '''
+    if env is None:
+        env = os.environ
+
     env_name = get_input_name(name)
-    val = os.environ.get(env_name, '')
+    val = env.get(env_name, '')
 
     if required and not val:
         raise InputError(
@@ -89,7 +131,8 @@ def get_multiline_input(
     *,
     required: bool = False,
     trim_whitespace: bool = True,
-    skip_empty_lines: bool = True
+    skip_empty_lines: bool = True,
+    env: Mapping[str, str] | None = None
 ) -> list[str]:
     '''
     Get the values of a multiline input.
@@ -105,6 +148,8 @@ def get_multiline_input(
         Options for retrieving the input, including:
         - All options from InputOptions
         - skipEmptyLines: Whether to filter empty lines (default: True)
+    env : Mapping[str, str] | None
+        Mapping to read the input from. Defaults to os.environ.
 
     Returns
     -------
@@ -128,22 +173,23 @@ def get_multiline_input(
     value = get_input(
         name,
         required=required,
-        trim_whitespace=trim_whitespace
+        trim_whitespace=trim_whitespace,
+        env=env
     )
 
-    lines = split_lines(value, skip_empty=skip_empty_lines)
-
-    if trim_whitespace:
-        lines = list(map(str.strip, lines))
-
-    return lines
+    return _split_multiline(
+        value,
+        skip_empty=skip_empty_lines,
+        trim=trim_whitespace
+    )
 
 
 def get_bool_input(
     name: str,
     *,
     required: bool = False,
-    trim_whitespace: bool = True
+    trim_whitespace: bool = True,
+    env: Mapping[str, str] | None = None
 ) -> bool:
     '''
     Get the value of an input as a boolean.
@@ -157,6 +203,8 @@ def get_bool_input(
         Name of the input to get.
     options : Optional[InputOptions]
         Options for retrieving the input.
+    env : Mapping[str, str] | None
+        Mapping to read the input from. Defaults to os.environ.
 
     Returns
     -------
@@ -183,6 +231,7 @@ def get_bool_input(
     val = get_input(
         name=name,
         required=required,
-        trim_whitespace=trim_whitespace
+        trim_whitespace=trim_whitespace,
+        env=env
     )
     return parse_yaml_boolean(val)
@@ -6,6 +6,8 @@ This module provides utility functions for converting values and properties
 from strings to command values, handling annotations, and parsing inputs.
 '''
 from __future__ import annotations
+from urllib.parse import urlparse
+
 from action_toolkit.corelib.types.core import YAML_BOOLEAN_FALSE, YAML_BOOLEAN_TRUE
 
 
@@ -141,8 +143,12 @@ def is_valid_url(url: str) -> bool:
     bool
         True if the string is a valid URL, False otherwise.
     '''
+    # a url with both a scheme and netloc must contain '://', so
+    # skip the full parse for anything that obviously cannot be one
+    if not isinstance(url, str) or '://' not in url:
+        return False
+
     try:
-        from urllib.parse import urlparse
         result = urlparse(url)
         return all([result.scheme, result.netloc])
     except Exception:
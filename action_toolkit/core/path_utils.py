@@ -7,11 +7,15 @@ mirror the path-utils functionality in @actions/core.
 '''
 
 from __future__ import annotations
+import functools
+import os
 import sys
 from pathlib import Path
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from action_toolkit.corelib.types.io import StringOrPathlib
 
 
@@ -44,10 +48,7 @@ def to_posix_path(path: StringOrPathlib) -> str:
     '/home/user/documents'  # On Unix
     'C:/Users/user/documents'  # On Windows
     '''
-    if isinstance(path, Path):
-        path = str(path)
-
-    return path.replace('\\', '/')
+    return os.fspath(path).replace('\\', '/')
 
 
 def to_win32_path(path: StringOrPathlib) -> str:
@@ -78,12 +79,49 @@ def to_win32_path(path: StringOrPathlib) -> str:
     >>> to_win32_path('relative/path/file.txt')
     'relative\\path\\file.txt'
     '''
-    if isinstance(path, Path):
-        path = str(path)
+    return os.fspath(path).replace('/', '\\')
+
 
-    normalized = path.replace('\\', '/')
+def to_posix_paths(paths: Iterable[StringOrPathlib]) -> list[str]:
+    '''
+    Convert many paths to POSIX format in one pass.
 
-    return normalized.replace('/', '\\')
+    Equivalent to ``[to_posix_path(p) for p in paths]`` without the
+    per-path function call.
+
+    Parameters
+    ----------
+    paths : Iterable[StringOrPathlib]
+        The paths to convert.
+
+    Returns
+    -------
+    list[str]
+        The paths in POSIX format, in input order.
+    '''
+    fspath = os.fspath
+    return [fspath(path).replace('\\', '/') for path in paths]
+
+
+def to_win32_paths(paths: Iterable[StringOrPathlib]) -> list[str]:
+    '''
+    Convert many paths to Windows format in one pass.
+
+    Equivalent to ``[to_win32_path(p) for p in paths]`` without the
+    per-path function call.
+
+    Parameters
+    ----------
+    paths : Iterable[StringOrPathlib]
+        The paths to convert.
+
+    Returns
+    -------
+    list[str]
+        The paths in Windows format, in input order.
+    '''
+    fspath = os.fspath
+    return [fspath(path).replace('/', '\\') for path in paths]
 
 
 def to_platform_path(path: StringOrPathlib) -> str:
@@ -116,10 +154,18 @@ def to_platform_path(path: StringOrPathlib) -> str:
     if isinstance(path, Path):
         return str(path)
 
-    if sys.platform.startswith('win'):
-        return to_win32_path(path)
-    else:
-        return to_posix_path(path)
+    return _platform_converter(path)
+
+
+def _select_platform_converter(platform: str) -> Callable[[StringOrPathlib], str]:
+    '''Returns the separator converter used by to_platform_path on platform.'''
+    if platform.startswith('win'):
+        return to_win32_path
+    return to_posix_path
+
+
+# the runner's platform never changes mid-process, so resolve it once
+_platform_converter = _select_platform_converter(sys.platform)
 
 
 def normalize_path(path: StringOrPathlib) -> str:
@@ -148,7 +194,38 @@ def normalize_path(path: StringOrPathlib) -> str:
 
     >>> normalize_path('~/documents')
     '/home/user/documents'  # Expanded home directory
+
+    Notes
+    -----
+    Absolute paths without '..' are normalized lexically, they are not
+    resolved against the filesystem so symlinks in them are kept. Other
+    results are cached per path, and per working directory for relative
+    paths, call `clear_normalize_path_cache` if symlinks or the home
+    directory change while the process is running.
     '''
+    path = os.fspath(path)
+    if os.path.isabs(path):
+        if '..' not in path:
+            return os.path.normpath(path)
+        # absolute paths do not depend on the working directory, which
+        # may also have been removed
+        return _normalize_path_cached(path, '')
+    return _normalize_path_cached(path, os.getcwd())
+
+
+def clear_normalize_path_cache() -> None:
+    '''
+    Clear the results cached by `normalize_path`.
+
+    Call this after symlinks, the home directory or the contents of a
+    previously normalized working directory change.
+    '''
+    _normalize_path_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_path_cached(path: str, cwd: str) -> str:
+    '''Cached body of normalize_path, ``cwd`` is only used as part of the cache key.'''
     p = Path(path).expanduser()
 
     try:
@@ -184,7 +261,7 @@ def is_absolute(path: StringOrPathlib) -> bool:
     >>> is_absolute('relative/path')
     False
     '''
-    return Path(path).is_absolute()
+    return os.path.isabs(os.fspath(path))
 
 
 def get_relative_path(
@@ -204,11 +281,19 @@ def get_relative_path(
     str
         _relative path_
     '''
-    t = Path(target).resolve(strict=False)
-    b = Path(base).resolve(strict=False)
-    try:
-        return str(t.relative_to(b))
-    except ValueError:
-        anchor = Path(t.anchor)
-        parts_after_anchor = t.parts[len(anchor.parts):]
-        return Path(*parts_after_anchor).as_posix()
\ No newline at end of file
+    realpath, normcase = os.path.realpath, os.path.normcase
+    t = realpath(target)
+    b = realpath(base)
+
+    folded_t, folded_b = normcase(t), normcase(b)
+    if folded_t == folded_b:
+        return '.'
+
+    prefix = folded_b if folded_b.endswith(os.sep) else folded_b + os.sep
+    if folded_t.startswith(prefix):
+        return t[len(prefix):]
+
+    # unrelated trees, fall back to the target with its anchor stripped
+    _, tail = os.path.splitdrive(t)
+    tail = tail.lstrip(os.sep)
+    return tail.replace(os.sep, '/') if tail else '.'
@@ -1,7 +1,12 @@
 '''
 **action_toolkit.internals**
 '''
-EXC_FORMAT = 'PyActionToolkit.{name}: {message}.\n<cause={cause}>'
+from typing import ClassVar
+
+EXC_PREFIX_FORMAT = 'PyActionToolkit.{name}: '
+# full message format, kept for callers that format messages themselves
+EXC_FORMAT = EXC_PREFIX_FORMAT + '{message}.\n<cause={cause}>'
+
 
 class BaseActionError(Exception):
     '''
@@ -11,6 +16,13 @@ class BaseActionError(Exception):
     It is used to catch all toolkit-related errors in a single block.
     '''
 
+    _prefix: ClassVar[str] = EXC_PREFIX_FORMAT.format(name='BaseActionError')
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        '''Precomputes the message prefix for each subclass.'''
+        super().__init_subclass__(**kwargs)
+        cls._prefix = EXC_PREFIX_FORMAT.format(name=cls.__name__)
+
     def __init__(self, message: str, *, cause: Exception | None = None) -> None:
         '''
         Initialize the ActionToolkitError, base exception for all toolkit errors.
@@ -19,9 +31,6 @@ class BaseActionError(Exception):
             message: Optional error message.
             cause: Optional underlying exception that caused this error.
         '''
-        self.message = EXC_FORMAT.format(
-            name=self.__class__.__name__,
-            message=message,
-            cause=cause.__class__.__name__ if cause else 'N/A'
-        )
-        super().__init__(self.message)
\ No newline at end of file
+        cause_name = cause.__class__.__name__ if cause else 'N/A'
+        self.message = f'{self._prefix}{message}.\n<cause={cause_name}>'
+        super().__init__(self.message)
@@ -2,17 +2,94 @@
 action_toolkit.internals.dataclass_utils
 '''
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 import json
 import dataclasses
+import operator
+import weakref
+
+# values of these types are returned as-is by dataclasses.asdict, so a
+# dataclass holding only these can be dumped without asdict's recursion
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+_EMPTY_EXCLUDE: frozenset[str] = frozenset()
+
+_FieldGetter = Callable[[Any], tuple[Any, ...]]
+
+_FIELD_ACCESSORS: weakref.WeakKeyDictionary[type, tuple[tuple[str, ...], _FieldGetter]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _field_accessor(cls: type) -> tuple[tuple[str, ...], _FieldGetter]:
+    '''Returns the field names of a dataclass type and a getter that reads
+    all of their values off an instance, cached per class.
+
+    The getter reads every field in one attrgetter call, attrgetter rather
+    than itemgetter on ``__dict__`` since slotted dataclasses have no
+    instance dict. A field that is unset, e.g. an ``init=False`` slot,
+    reads as None like ``getattr(obj, name, None)``.
+    '''
+    accessor = _FIELD_ACCESSORS.get(cls)
+    if accessor is None:
+        names = tuple(field.name for field in dataclasses.fields(cls))
+        # attrgetter returns a bare value for one name and needs at least one
+        fast = operator.attrgetter(*names) if len(names) > 1 else None
+
+        def getter(obj: Any) -> tuple[Any, ...]:
+            if fast is not None:
+                try:
+                    return fast(obj)
+                except AttributeError:
+                    pass
+            return tuple(getattr(obj, name, None) for name in names)
+
+        accessor = _FIELD_ACCESSORS[cls] = (names, getter)
+    return accessor
+
+
+_DUMPERS: weakref.WeakKeyDictionary[type, Callable[[Any], dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _exclude_set(exclude: Iterable[str] | None) -> frozenset[str]:
+    '''Coerces an exclude argument to a frozenset once per call, so any
+    iterable of names gets O(1) membership checks.'''
+    if not exclude:
+        return _EMPTY_EXCLUDE
+    if isinstance(exclude, frozenset):
+        return exclude
+    return frozenset(exclude)
+
+
+def _dumper(cls: type) -> Callable[[Any], dict[str, Any]]:
+    '''Returns a function specialized to build the shallow field dict of a
+    dataclass type, cached per class.
+
+    The function is generated as a single dict display, the same way
+    dataclasses generates __init__ and __repr__, so a dump costs one
+    attribute load per field and nothing else. Field names are always
+    valid identifiers, which keeps the generated source safe.
+    '''
+    dumper = _DUMPERS.get(cls)
+    if dumper is None:
+        names, _ = _field_accessor(cls)
+        items = ', '.join(f'{name!r}: obj.{name}' for name in names)
+        namespace: dict[str, Any] = {}
+        exec(f'def dump(obj):\n    return {{{items}}}\n', namespace)
+        dumper = _DUMPERS[cls] = namespace['dump']
+        dumper.__qualname__ = f'dump_{cls.__qualname__}'
+    return dumper
+
 
 def dump_dataclass(
     data_cls: Any,
     *,
     exclude_none: bool = False,
-    exclude: set[str] | None = None
+    exclude: Iterable[str] | None = None
 ) -> dict[str, Any]:
     '''Convert a dataclass to a dictionary with options to exclude fields.
 
@@ -22,58 +99,65 @@ def dump_dataclass(
         The dataclass instance to convert.
     exclude_none : bool, optional
         If True, exclude fields with None values (default is False).
-    exclude : set[str] | None, optional
-        A set of field names to exclude from the dictionary (default is None).
+    exclude : Iterable[str] | None, optional
+        Field names to exclude from the dictionary (default is None).
     '''
-    dump = dataclasses.asdict(data_cls)
-    if not exclude and not exclude_none:
+    excluded = _exclude_set(exclude)
+    dump = _dumper(type(data_cls))(data_cls)
+    for value in dump.values():
+        if type(value) not in _ATOMIC_TYPES:
+            dump = dataclasses.asdict(data_cls)
+            break
+
+    if not excluded and not exclude_none:
         return dump
 
-    for field in dataclasses.fields(data_cls):
-        if exclude and field.name in exclude:
-            dump.pop(field.name, None)
-
-        elif exclude_none and dump.get(field.name) is None:
-            dump.pop(field.name, None)
+    return {
+        name: value for name, value in dump.items()
+        if name not in excluded
+        and not (exclude_none and value is None)
+    }
 
-    return dump
 
 def iter_dataclass_dict(
     data_cls: Any,
     *,
     exclude_none: bool = False,
-    exclude: set[str] | None = None
+    exclude: Iterable[str] | None = None
 ) -> Iterable[tuple[str, Any]]:
     '''Iterate over the fields of a dataclass as key-value pairs.
 
     Parameters
     ----------
     cls : BaseDataclass
-        The dataclass instance to iterate over.
+        The dataclass instance to iterate over. Given a dataclass type,
+        fields with a default yield it and the others yield None.
     exclude_none : bool, optional
         If True, exclude fields with None values (default is False).
-    exclude : set[str] | None, optional
-        A set of field names to exclude from the iteration (default is None).
+    exclude : Iterable[str] | None, optional
+        Field names to exclude from the iteration (default is None).
 
     Returns
     -------
     Iterable[tuple[str, Any]]
         An iterable of key-value pairs representing the fields and their values.
     '''
-    for field in dataclasses.fields(data_cls):
-        if exclude and field.name in exclude:
+    excluded = _exclude_set(exclude)
+    cls = data_cls if isinstance(data_cls, type) else type(data_cls)
+    names, getter = _field_accessor(cls)
+    for name, value in zip(names, getter(data_cls)):
+        if name in excluded:
             continue
-        value = getattr(data_cls, field.name, None)
         if exclude_none and value is None:
             continue
-        yield field.name, value
+        yield name, value
 
 
 def json_dumps_dataclass(
     data_cls: Any,
     *,
     exclude_none: bool = False,
-    exclude: set[str] | None = None
+    exclude: Iterable[str] | None = None
 ) -> str:
     '''Convert a dataclass to a JSON string.
 
@@ -83,8 +167,8 @@ def json_dumps_dataclass(
         The dataclass instance to convert.
     exclude_none : bool, optional
         If True, exclude fields with None values (default is False).
-    exclude : set[str] | None, optional
-        A set of field names to exclude from the JSON output (default is None).
+    exclude : Iterable[str] | None, optional
+        Field names to exclude from the JSON output (default is None).
 
     Returns
     -------
@@ -103,14 +187,16 @@ def iter_dataclass(data_cls: Any) -> Iterator[tuple[str, Any]]:
     Parameters
     ----------
     cls : BaseDataclass
-        The dataclass instance to iterate over.
+        The dataclass instance to iterate over. Given a dataclass type,
+        fields with a default yield it and the others yield None.
 
     Returns
     -------
     Iterator[tuple[str, Any]]
         An iterator of key-value pairs representing the fields and their values.
     '''
-    for field in dataclasses.fields(data_cls):
-        yield field.name, getattr(data_cls, field.name, None)
+    cls = data_cls if isinstance(data_cls, type) else type(data_cls)
+    names, getter = _field_accessor(cls)
+    return zip(names, getter(data_cls))
 
 
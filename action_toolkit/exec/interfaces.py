@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping, Callable
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class ExecOptions:
     '''
     Initialize execution options.
@@ -44,38 +44,46 @@ class ExecOptions:
 
     def __post_init__(self) -> None:
         if self.cwd is not None:
-            self.cwd = Path(self.cwd)
+            object.__setattr__(self, 'cwd', Path(self.cwd))
         if self.env is not None:
-            self.env = dict(self.env)
+            object.__setattr__(self, 'env', dict(self.env))
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class ExecListeners:
     '''
     Callbacks for handling process output for exec functions.
     Initialize execution listeners.
 
+    exec reads stdout and stderr on separate worker threads, so the
+    stdout and stderr listeners are called from those threads rather than
+    the calling one. The calls are serialized, a listener never runs
+    concurrently with another, and each runs in a copy of the caller's
+    context so context variables set by the caller are visible. exec_async
+    calls them on the event loop. If a listener raises, the process is
+    killed and the exception propagates from exec/exec_async.
+
     Parameters
     ----------
-    stdout : Callable[[str], None] | None
-        Called for each line of stdout output.
-    stderr : Callable[[str], None] | None
-        Called for each line of stderr output.
+    stdout : Callable[[str | bytes], None] | None
+        Called for each line of stdout output, a str unless raw is set.
+    stderr : Callable[[str | bytes], None] | None
+        Called for each line of stderr output, a str unless raw is set.
     debug : Callable[[str], None] | None
         Called for debug messages during execution.
+    raw : bool
+        If True, stdout/stderr listeners receive each line as undecoded
+        bytes with its line ending, for callers that only forward output.
+        The ExecResult output is UTF-8 decoded with replacement either way.
     '''
 
-    stdout: Callable[[str], None] | None = None
-    stderr: Callable[[str], None] | None = None
+    stdout: Callable[[str | bytes], None] | None = None
+    stderr: Callable[[str | bytes], None] | None = None
     debug: Callable[[str], None] | None = None
-
-    def __post_init__(self) -> None:
-        '''
-        '''
-        pass
+    raw: bool = False
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class ExecResult:
     '''
     Wrapper class for process execution results.
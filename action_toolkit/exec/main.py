@@ -3,9 +3,13 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncGenerator
 import contextlib
+import contextvars
 import os
+import re
 import subprocess
-from typing import TYPE_CHECKING
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, Final
 
 from action_toolkit.corelib.types.io import StringOrPathlib
 
@@ -14,7 +18,208 @@ from .exceptions import ExecError
 from action_toolkit import core
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence, Generator
+    from collections.abc import Callable, Mapping, Sequence, Generator
+
+
+_DEFAULT_OPTIONS: Final[ExecOptions] = ExecOptions()
+_DEFAULT_LISTENERS: Final[ExecListeners] = ExecListeners()
+_ASYNC_READ_SIZE: Final[int] = 64 * 1024
+_LINE_BREAK: Final[re.Pattern[bytes]] = re.compile(rb'\r\n|\r|\n')
+_RAW_LINE_BREAK: Final[re.Pattern[bytes]] = re.compile(rb'\n')
+
+
+def _merge_env(overrides: Mapping[str, str] | None) -> dict[str, str] | None:
+    '''
+    Builds the child environment for a command.
+
+    Without overrides None is returned so the child inherits the current
+    environment directly and os.environ is not copied. os.environ is read
+    at call time, so variables exported during the run are picked up.
+    '''
+    if not overrides:
+        return None
+    return {**os.environ, **overrides}
+
+
+class _StreamState:
+    '''
+    State shared by the pump threads of one streaming exec call.
+
+    Listener calls are serialized by ``lock`` and run in a copy of the
+    calling thread's context, so listeners see its context variables and
+    never run concurrently even though each pipe has its own thread.
+    '''
+
+    __slots__ = ('process', 'context', 'lock', 'stopped', 'settled', 'failures', '_running')
+
+    def __init__(self, process: subprocess.Popen[Any], pumps: int) -> None:
+        self.process = process
+        self.context = contextvars.copy_context()
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.settled = threading.Event()
+        self.failures: list[BaseException] = []
+        self._running = pumps
+
+    def emit(self, listener: Callable[[Any], None], line: Any) -> bool:
+        '''Calls the listener with a line, returns False once it should be dropped.'''
+        with self.lock:
+            if self.stopped.is_set():
+                return False
+            try:
+                self.context.run(listener, line)
+            except BaseException as e:
+                self.fail(e)
+                return False
+        return True
+
+    def fail(self, error: BaseException) -> None:
+        '''Records a listener error and kills the process right away.'''
+        self.failures.append(error)
+        self.stopped.set()
+        with contextlib.suppress(OSError):
+            self.process.kill()
+        self.settled.set()
+
+    def finish(self) -> None:
+        '''Marks one pump as drained, settling the call once all are.'''
+        with self.lock:
+            self._running -= 1
+            if not self._running:
+                self.settled.set()
+
+
+def _pump(
+    stream: IO[Any],
+    listener: Callable[[Any], None] | None,
+    sink: list[Any],
+    state: _StreamState,
+    *,
+    raw: bool = False
+) -> None:
+    '''Drains a process pipe line by line, forwarding each line to the listener.
+
+    In raw mode the pipe is binary and lines are forwarded undecoded with
+    their line endings, otherwise the trailing newline is stripped. Once
+    the call is stopped the pipe is still drained but no longer forwarded.
+    '''
+    try:
+        with stream:
+            for line in iter(stream.readline, b'' if raw else ''):
+                sink.append(line)
+                if listener is not None and not state.emit(
+                    listener, line if raw else line.rstrip('\n')
+                ):
+                    listener = None
+    finally:
+        state.finish()
+
+
+def _run_streaming(
+    command_parts: list[str],
+    *,
+    options: ExecOptions,
+    env: Mapping[str, str] | None,
+    listeners: ExecListeners
+) -> tuple[int, str, str]:
+    '''
+    Runs a command, invoking listeners as output arrives rather than
+    after the process exits.
+
+    Each pipe is drained by its own thread so neither can fill up and
+    block the child, the calling thread only waits on the process. With
+    listeners.raw the pipes are read as bytes and only the collected
+    output is decoded, once, for the result.
+
+    options.timeout bounds the whole call, including draining the pipes,
+    which stay open for as long as any process the child spawned holds
+    them. On timeout or a listener error the pump threads are abandoned
+    and stop forwarding.
+
+    Returns
+    -------
+    tuple[int, str, str]
+        The exit code, stdout and stderr of the process.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If the process outlives options.timeout, it is killed first.
+    BaseException
+        The first exception raised by a listener, the process is killed
+        as soon as it is raised.
+    '''
+    process = subprocess.Popen(
+        command_parts,
+        cwd=options.cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=not listeners.raw,
+        encoding=None if listeners.raw else 'utf-8',
+        errors=None if listeners.raw else 'replace'
+    )
+
+    raw = listeners.raw
+    state = _StreamState(process, pumps=2)
+    stdout_sink: list[Any] = []
+    stderr_sink: list[Any] = []
+    pumps = [
+        threading.Thread(
+            target=_pump,
+            args=(process.stdout, listeners.stdout, stdout_sink, state),
+            kwargs={'raw': raw},
+            daemon=True
+        ),
+        threading.Thread(
+            target=_pump,
+            args=(process.stderr, listeners.stderr, stderr_sink, state),
+            kwargs={'raw': raw},
+            daemon=True
+        )
+    ]
+    for pump in pumps:
+        pump.start()
+
+    timeout = options.timeout
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        exit_code = process.wait(timeout=timeout)
+        if not state.settled.wait(
+            None if deadline is None else max(0.0, deadline - time.monotonic())
+        ):
+            raise subprocess.TimeoutExpired(command_parts, timeout)
+    except BaseException:
+        state.stopped.set()
+        process.kill()
+        process.wait()
+        raise
+
+    if state.failures:
+        raise state.failures[0]
+
+    if raw:
+        return exit_code, _decode(b''.join(stdout_sink)), _decode(b''.join(stderr_sink))
+    return exit_code, ''.join(stdout_sink), ''.join(stderr_sink)
+
+
+def _decode(data: bytes | None) -> str:
+    '''Decodes captured output, UTF-8 with replacement like the text pipes.'''
+    return data.decode('utf-8', 'replace') if data else ''
+
+
+def _emit_lines(
+    listener: Callable[[Any], None] | None,
+    data: str | bytes,
+    *,
+    raw: bool
+) -> None:
+    '''Forwards already collected output to a listener line by line.'''
+    if listener is None or not data:
+        return
+    for line in data.splitlines(keepends=raw):
+        listener(line)
+
 
 def exec(
     tool: str,
@@ -55,8 +260,8 @@ def exec(
     >>> options = ExecOptions(cwd='/tmp', silent=True)
     >>> result = exec('ls', ['-la'], options=options)
     '''
-    options = options or ExecOptions()
-    listeners = listeners or ExecListeners()
+    options = options if options is not None else _DEFAULT_OPTIONS
+    listeners = listeners if listeners is not None else _DEFAULT_LISTENERS
     command_parts = [tool] + list(args or [])
     command_str = ' '.join(command_parts)
 
@@ -64,31 +269,43 @@ def exec(
         core.debug(message=f'Executing: {command_str}')
 
     try:
-        env = dict(os.environ)
-        if options.env:
-            env.update(options.env)
-
-        process = subprocess.run(
-            command_parts,
-            cwd=options.cwd,
-            env=env,
-            input=options.input,
-            capture_output=True,
-            text=True,
-            timeout=options.timeout,
-            check=False
-        )
-
-        stdout = process.stdout or ''
-        stderr = process.stderr or ''
-
-        if listeners and listeners.stdout and stdout:
-            for line in stdout.splitlines():
-                listeners.stdout(line)
+        env = _merge_env(options.env)
+
+        if options.input is None:
+            exit_code, stdout, stderr = _run_streaming(
+                command_parts,
+                options=options,
+                env=env,
+                listeners=listeners
+            )
+        else:
+            # stdin has to be fed in full anyway, let communicate() handle it
+            stdin = options.input
+            if listeners.raw and isinstance(stdin, str):
+                stdin = stdin.encode()
+
+            process = subprocess.run(
+                command_parts,
+                cwd=options.cwd,
+                env=env,
+                input=stdin,
+                capture_output=True,
+                text=not listeners.raw,
+                encoding=None if listeners.raw else 'utf-8',
+                errors=None if listeners.raw else 'replace',
+                timeout=options.timeout,
+                check=False
+            )
+            exit_code = process.returncode
+            _emit_lines(listeners.stdout, process.stdout, raw=listeners.raw)
+            _emit_lines(listeners.stderr, process.stderr, raw=listeners.raw)
 
-        if listeners.stderr and stderr:
-            for line in stderr.splitlines():
-                listeners.stderr(line)
+            if listeners.raw:
+                stdout = _decode(process.stdout)
+                stderr = _decode(process.stderr)
+            else:
+                stdout = process.stdout or ''
+                stderr = process.stderr or ''
 
         if not options.silent:
             if stdout.strip():
@@ -100,16 +317,16 @@ def exec(
                     core.debug(message=f'stderr: {line}')
 
         result = ExecResult(
-            exit_code=process.returncode,
+            exit_code=exit_code,
             stdout=stdout,
             stderr=stderr,
             command=command_str
         )
 
-        if not options.ignore_return_code and process.returncode != 0:
+        if not options.ignore_return_code and exit_code != 0:
             raise ExecError(
                 command=command_str,
-                exit_code=process.returncode,
+                exit_code=exit_code,
                 stdout=stdout,
                 stderr=stderr
             )
@@ -117,7 +334,7 @@ def exec(
         if options.fail_on_stderr and stderr.strip():
             raise ExecError(
                 command=command_str,
-                exit_code=process.returncode,
+                exit_code=exit_code,
                 stdout=stdout,
                 stderr=stderr,
                 message=f'Command "{command_str}" produced stderr output'
@@ -179,8 +396,8 @@ async def exec_async(
     >>>
     >>> asyncio.run(main())
     '''
-    options = options or ExecOptions()
-    listeners = listeners or ExecListeners()
+    options = options if options is not None else _DEFAULT_OPTIONS
+    listeners = listeners if listeners is not None else _DEFAULT_LISTENERS
     command_parts = [tool] + list(args or [])
     command_str = ' '.join(command_parts)
 
@@ -188,9 +405,7 @@ async def exec_async(
         core.debug(message=f'Executing async: {command_str}')
 
     try:
-        env = dict(os.environ)
-        if options.env:
-            env.update(options.env)
+        env = _merge_env(options.env)
 
         process = await asyncio.create_subprocess_exec(
             *command_parts,
@@ -205,21 +420,31 @@ async def exec_async(
         if options.input:
             input_bytes = options.input.encode() if isinstance(options.input, str) else options.input
 
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            process.communicate(input_bytes),
-            timeout=options.timeout
-        )
-
-        stdout = stdout_bytes.decode() if stdout_bytes else ''
-        stderr = stderr_bytes.decode() if stderr_bytes else ''
-
-        if listeners.stdout and stdout:
-            for line in stdout.splitlines():
-                listeners.stdout(line)
-
-        if listeners.stderr and stderr:
-            for line in stderr.splitlines():
-                listeners.stderr(line)
+        stdout_chunks: list[bytes] = []
+        stderr_chunks: list[bytes] = []
+        tasks = [
+            asyncio.ensure_future(_feed_stdin_async(process.stdin, input_bytes)),
+            asyncio.ensure_future(
+                _pump_async(process.stdout, listeners.stdout, stdout_chunks, raw=listeners.raw)
+            ),
+            asyncio.ensure_future(
+                _pump_async(process.stderr, listeners.stderr, stderr_chunks, raw=listeners.raw)
+            ),
+            asyncio.ensure_future(process.wait())
+        ]
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=options.timeout)
+        except BaseException:
+            # a timeout, a failing listener or our own cancellation, none of
+            # which may leave the child or the sibling tasks running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await _terminate_async(process)
+            raise
+
+        stdout = _decode(b''.join(stdout_chunks))
+        stderr = _decode(b''.join(stderr_chunks))
 
         if not options.silent:
             if stdout.strip():
@@ -257,10 +482,6 @@ async def exec_async(
         return result
 
     except asyncio.TimeoutError as e:
-        if process:
-            process.terminate()
-            await process.wait()
-
         raise ExecError(
             command=command_str,
             exit_code=-1,
@@ -275,6 +496,89 @@ async def exec_async(
         ) from e
 
 
+async def _terminate_async(process: asyncio.subprocess.Process) -> None:
+    '''Terminates a process that is still running and reaps it.'''
+    if process.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            process.terminate()
+    await process.wait()
+
+
+async def _feed_stdin_async(
+    stdin: asyncio.StreamWriter | None,
+    data: bytes | None
+) -> None:
+    '''Writes the process input and closes stdin, ignoring an early exit.'''
+    if stdin is None:
+        return
+    with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+        if data:
+            stdin.write(data)
+            await stdin.drain()
+        stdin.close()
+
+
+def _take_lines(buffer: bytearray, scan_from: int, *, raw: bool) -> tuple[list[bytes], int]:
+    '''
+    Removes the complete lines at the front of ``buffer``.
+
+    Lines end the way the sync pumps see them: on ``\\n`` in raw mode,
+    keeping the ending, otherwise on ``\\r\\n``, ``\\r`` or ``\\n`` like
+    universal newlines, without the ending. A trailing ``\\r`` is left in
+    the buffer since the next read may complete it to ``\\r\\n``.
+
+    Returns
+    -------
+    tuple[list[bytes], int]
+        The lines, and the offset to resume scanning from on the next call
+        so a long unterminated line is only scanned once.
+    '''
+    pattern = _RAW_LINE_BREAK if raw else _LINE_BREAK
+    lines: list[bytes] = []
+    begin = 0
+    while (match := pattern.search(buffer, scan_from)) is not None:
+        if match.end() == len(buffer) and match.group() == b'\r':
+            break
+        lines.append(bytes(buffer[begin:match.end() if raw else match.start()]))
+        begin = scan_from = match.end()
+
+    del buffer[:begin]
+    return lines, max(len(buffer) - 1, 0)
+
+
+async def _pump_async(
+    stream: asyncio.StreamReader,
+    listener: Callable[[Any], None] | None,
+    sink: list[bytes],
+    *,
+    raw: bool = False
+) -> None:
+    '''
+    Async counterpart of _pump, forwards lines to the listener while the
+    process is still running.
+
+    The pipe is read in fixed-size chunks rather than with readline(), so
+    a single line longer than the StreamReader limit cannot raise.
+    '''
+    buffer = bytearray()
+    scan_from = 0
+    while chunk := await stream.read(_ASYNC_READ_SIZE):
+        sink.append(chunk)
+        if listener is None:
+            continue
+
+        buffer += chunk
+        lines, scan_from = _take_lines(buffer, scan_from, raw=raw)
+        for line in lines:
+            listener(line if raw else _decode(line))
+
+    if listener is not None and buffer:
+        if raw:
+            listener(bytes(buffer))
+        else:
+            listener(_decode(bytes(buffer.removesuffix(b'\r'))))
+
+
 @contextlib.contextmanager
 def exec_context(
     *,
@@ -0,0 +1,4 @@
+'''YAML 1.2 boolean spellings shared by the parse_yaml_boolean and get_bool_input tests'''
+
+YAML_TRUTHY = ('true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'on', 'On', 'ON', 'y', 'Y', '1')
+YAML_FALSY = ('false', 'False', 'FALSE', 'no', 'No', 'NO', 'off', 'Off', 'OFF', 'n', 'N', '0')
@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _input_env_isolation():
+    '''Restores the ``INPUT_*`` environment variables after each test.
+
+    Only the action input keys are snapshotted rather than the whole
+    environment, so tests may set ``os.environ['INPUT_X']`` directly.
+    '''
+    saved = {k: v for k, v in os.environ.items() if k.startswith('INPUT_')}
+    yield
+    for key in [k for k in os.environ if k.startswith('INPUT_')]:
+        if key not in saved:
+            del os.environ[key]
+    os.environ.update(saved)
@@ -62,10 +62,7 @@ class TestAnnotationProperties:
 
     def test_frozen_dataclass(self):
         '''Test that AnnotationProperties is frozen'''
-        props = AnnotationProperties(title="Test")
-
-        with pytest.raises(AttributeError):
-            props.title = "Modified"  # type: ignore
+        assert AnnotationProperties.__dataclass_params__.frozen is True  # type: ignore[attr-defined]
 
     def test_valid_column_with_same_lines(self):
         '''Test that columns are valid when lines are the same'''
@@ -8,48 +8,44 @@ from action_toolkit.core.internals.utils import (
     is_valid_url
 )
 
+from tests._yaml_values import YAML_FALSY, YAML_TRUTHY
+
+
+_VALID_URLS = (
+    'http://example.com',
+    'https://example.com',
+    'https://example.com/path',
+    'http://example.com:8080',
+    'https://example.com/path?query=value',
+    'ftp://files.example.com',
+    'https://sub.domain.example.com',
+    'http://192.168.1.1',
+    'https://example.com/path#anchor',
+    'https://example.com/path%20with%20spaces',
+)
+
+_INVALID_URLS = (
+    '',
+    'not a url',
+    'example.com',  # Missing scheme
+    'http://',  # Missing netloc
+    'http:example.com',  # Invalid format
+    '//example.com',  # Missing scheme
+    'javascript:alert(1)',  # Has scheme but no netloc
+    'file:///path/to/file',  # Has scheme but no netloc
+    'mailto:user@example.com',  # Has scheme but no netloc
+)
+
 
 class TestParseYamlBoolean:
     '''Test cases for parse_yaml_boolean function'''
 
-    @pytest.mark.parametrize(
-        "value",
-        [
-            'true',
-            'True',
-            'TRUE',
-            'yes',
-            'Yes',
-            'YES',
-            'on',
-            'On',
-            'ON',
-            'y',
-            'Y',
-            '1',
-        ]
-    )
+    @pytest.mark.parametrize("value", YAML_TRUTHY, ids=str)
     def test_truthy_values(self, value) -> None:
         '''Test all YAML truthy values'''
         assert parse_yaml_boolean(value) is True, f"Failed for value: {value}"
 
-    @pytest.mark.parametrize(
-        "value",
-        [
-            'false',
-            'False',
-            'FALSE',
-            'no',
-            'No',
-            'NO',
-            'off',
-            'Off',
-            'OFF',
-            'n',
-            'N',
-            '0',
-        ]
-    )
+    @pytest.mark.parametrize("value", YAML_FALSY, ids=str)
     def test_falsy_values(self, value):
         '''Test YAML falsy values and other strings'''
         assert parse_yaml_boolean(value) is False, f"Failed for value: {value}"
@@ -169,40 +165,12 @@ class TestSplitLines:
 class TestIsValidUrl:
     '''Test cases for is_valid_url function'''
 
-    @pytest.mark.parametrize(
-        "url",
-        [
-            'http://example.com',
-            'https://example.com',
-            'https://example.com/path',
-            'http://example.com:8080',
-            'https://example.com/path?query=value',
-            'ftp://files.example.com',
-            'https://sub.domain.example.com',
-            'http://192.168.1.1',
-            'https://example.com/path#anchor',
-            'https://example.com/path%20with%20spaces',
-        ]
-    )
+    @pytest.mark.parametrize("url", _VALID_URLS, ids=str)
     def test_valid_urls(self, url):
         '''Test valid URLs'''
         assert is_valid_url(url) is True, f"Failed for URL: {url}"
 
-    @pytest.mark.parametrize(
-        "url",
-        [
-            '',
-            'not a url',
-            'example.com',  # Missing scheme
-            'http://',  # Missing netloc
-            'http:example.com',  # Invalid format
-            '//example.com',  # Missing scheme
-            'javascript:alert(1)',  # Has scheme but no netloc
-            'file:///path/to/file',  # Has scheme but no netloc
-            'mailto:user@example.com',  # Has scheme but no netloc
-
-        ]
-    )
+    @pytest.mark.parametrize("url", _INVALID_URLS, ids=str)
     def test_invalid_urls(self, url):
         '''Test invalid URLs'''
         assert is_valid_url(url) is False, f"Failed for URL: {url}"
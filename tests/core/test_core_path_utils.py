@@ -10,11 +10,15 @@ from unittest.mock import patch
 import pytest
 from action_toolkit.core.path_utils import (
     to_posix_path,
+    to_posix_paths,
     to_win32_path,
+    to_win32_paths,
     to_platform_path,
     normalize_path,
+    clear_normalize_path_cache,
     is_absolute,
-    get_relative_path
+    get_relative_path,
+    _select_platform_converter
 )
 
 
@@ -75,6 +79,22 @@ class TestToPosixPath:
         assert to_posix_path(
             input_path) == expected_output, f"Failed for {input_path}"
 
+    @pytest.mark.parametrize(
+        'paths',
+        [
+            [],
+            ['C:\\Users\\test\\file.txt'],
+            ['C:\\a\\b', '/already/posix', Path('rel') / 'file.txt', '\\\\server\\share'],
+        ]
+    )
+    def test_bulk_matches_scalar(self, paths):
+        '''Test to_posix_paths matches converting each path individually'''
+        assert to_posix_paths(paths) == [to_posix_path(p) for p in paths]
+
+    def test_bulk_accepts_generator(self):
+        '''Test to_posix_paths consumes any iterable'''
+        assert to_posix_paths(p for p in ('a\\b', 'c\\d')) == ['a/b', 'c/d']
+
 
 class TestToWin32Path:
     '''Test cases for to_win32_path function'''
@@ -116,25 +136,37 @@ class TestToWin32Path:
         assert to_win32_path('/') == '\\'
         assert to_win32_path('//') == '\\\\'
 
+    @pytest.mark.parametrize(
+        'paths',
+        [
+            [],
+            ['/home/user/file.txt'],
+            ['/usr/local/bin', 'C:/Users\\test', Path('rel') / 'file.txt', '//'],
+        ]
+    )
+    def test_bulk_matches_scalar(self, paths):
+        '''Test to_win32_paths matches converting each path individually'''
+        assert to_win32_paths(paths) == [to_win32_path(p) for p in paths]
+
 
 class TestToPlatformPath:
     '''Test cases for to_platform_path function'''
 
-    @patch('sys.platform', 'win32')
+    @patch('action_toolkit.core.path_utils._platform_converter', to_win32_path)
     def test_windows_platform(self):
         '''Test platform path on Windows'''
         assert to_platform_path(
             '/home/user/file.txt') == '\\home\\user\\file.txt'
         assert to_platform_path('C:\\Users\\test') == 'C:\\Users\\test'
 
-    @patch('sys.platform', 'linux')
+    @patch('action_toolkit.core.path_utils._platform_converter', to_posix_path)
     def test_linux_platform(self):
         '''Test platform path on Linux'''
         assert to_platform_path(
             'C:\\Users\\test\\file.txt') == 'C:/Users/test/file.txt'
         assert to_platform_path('/home/user') == '/home/user'
 
-    @patch('sys.platform', 'darwin')
+    @patch('action_toolkit.core.path_utils._platform_converter', to_posix_path)
     def test_macos_platform(self):
         '''Test platform path on macOS'''
         assert to_platform_path('C:\\Users\\test') == 'C:/Users/test'
@@ -146,6 +178,19 @@ class TestToPlatformPath:
         result = to_platform_path(path)
         assert result == str(path)
 
+    @pytest.mark.parametrize(
+        "platform, expected",
+        [
+            ('win32', to_win32_path),
+            ('cygwin', to_posix_path),
+            ('linux', to_posix_path),
+            ('darwin', to_posix_path),
+        ]
+    )
+    def test_select_platform_converter(self, platform, expected):
+        '''Test the converter chosen for each platform'''
+        assert _select_platform_converter(platform) is expected
+
     def test_current_platform(self):
         '''Test on current platform'''
         if sys.platform.startswith('win'):
@@ -196,6 +241,17 @@ class TestNormalizePath:
         result = normalize_path(path)
         assert is_absolute(result)
 
+    def test_absolute_fast_path_skips_filesystem(self):
+        '''Test clean absolute paths are normalized without resolving'''
+        path = os.path.join(os.path.abspath(os.sep), 'usr', '.', 'local', 'bin')
+
+        with patch('action_toolkit.core.path_utils._normalize_path_cached') as mock_cached:
+            result = normalize_path(path)
+
+        mock_cached.assert_not_called()
+        assert result == os.path.normpath(path)
+        assert '.' not in Path(result).parts
+
     def test_non_existent_path(self):
         '''Test normalizing non-existent paths'''
         result = normalize_path('./non/existent/path')
@@ -208,6 +264,47 @@ class TestNormalizePath:
         expected = str(Path('').absolute()).lower()
         assert result == expected
 
+    def test_cache_keyed_on_cwd(self):
+        '''Test cached results are not reused across working directories'''
+        clear_normalize_path_cache()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / 'first'
+            second = Path(tmpdir) / 'second'
+            first.mkdir()
+            second.mkdir()
+
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(first)
+                from_first = normalize_path('file.txt')
+                assert normalize_path('file.txt') == from_first
+
+                os.chdir(second)
+                from_second = normalize_path('file.txt')
+            finally:
+                os.chdir(original_cwd)
+
+        assert from_first != from_second
+        assert Path(from_second).parent.name == 'second'
+
+    @pytest.mark.skipif(sys.platform.startswith('win'), reason='cannot remove the current directory on Windows')
+    def test_absolute_path_with_removed_cwd(self):
+        '''Test absolute paths normalize even when the working directory is gone'''
+        clear_normalize_path_cache()
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gone = Path(tmpdir) / 'gone'
+            gone.mkdir()
+            try:
+                os.chdir(gone)
+                gone.rmdir()
+                result = normalize_path('/a/../b')
+            finally:
+                os.chdir(original_cwd)
+
+        assert result == '/b'
+
 
 class TestIsAbsolute:
     '''Test cases for is_absolute function'''
@@ -273,6 +370,16 @@ class TestGetRelativePath:
             result = get_relative_path('/usr/local/bin', '/home/user')
             assert result == os.path.join('usr', 'local', 'bin')
 
+    def test_sibling_with_shared_prefix(self):
+        '''Test a sibling whose name starts with the base is not nested'''
+        if not sys.platform.startswith('win'):
+            assert get_relative_path('/home/user2/file', '/home/user') == 'home/user2/file'
+
+    def test_unrelated_root_target(self):
+        '''Test a filesystem root target outside the base is "."'''
+        root = os.path.abspath(os.sep)
+        assert get_relative_path(root, os.path.join(root, 'home', 'user')) == '.'
+
     def test_with_dots(self):
         '''Test paths containing . and ..'''
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,7 +1,7 @@
 '''Tests for action_toolkit.internals.dataclass_utils module'''
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pytest
 from action_toolkit.corelib.utils.dataclass_utils import (
@@ -68,6 +68,40 @@ class TestDumpDataclass:
             'age': 35
         }
 
+    def test_nested_dump(self) -> None:
+        '''Test nested dataclasses are still converted recursively'''
+        @dataclass
+        class Wrapper:
+            label: str
+            inner: SampleDataclass
+            tags: list[str]
+
+        obj = Wrapper(label='outer', inner=SampleDataclass(name='Eve', age=28), tags=['a'])
+        result = dump_dataclass(obj)
+
+        assert result == {
+            'label': 'outer',
+            'inner': {'name': 'Eve', 'age': 28, 'email': None, 'active': True},
+            'tags': ['a']
+        }
+        assert result['tags'] is not obj.tags
+
+    def test_dump_returns_fresh_dict(self) -> None:
+        '''Test repeated dumps of one class return independent dicts'''
+        first = dump_dataclass(SampleDataclass(name='A', age=1))
+        second = dump_dataclass(SampleDataclass(name='B', age=2))
+
+        first['name'] = 'changed'
+        assert second == {'name': 'B', 'age': 2, 'email': None, 'active': True}
+
+    def test_empty_dataclass(self) -> None:
+        '''Test a dataclass without fields dumps to an empty dict'''
+        @dataclass
+        class Empty:
+            pass
+
+        assert dump_dataclass(Empty()) == {}
+
 
 class TestIterDataclassDict:
     '''Test cases for iter_dataclass_dict function'''
@@ -102,6 +136,14 @@ class TestIterDataclassDict:
         assert len(items) == 2
         assert items == [('name', 'Test'), ('active', True)]
 
+    @pytest.mark.parametrize('exclude', [['age', 'email'], ('age', 'email', 'age'), frozenset({'age', 'email'})])
+    def test_exclude_accepts_any_iterable(self, exclude):
+        '''Test exclude may be any iterable of field names'''
+        obj = SampleDataclass(name="Test", age=20, email="test@test.com")
+
+        assert list(iter_dataclass_dict(obj, exclude=exclude)) == [('name', 'Test'), ('active', True)]
+        assert dump_dataclass(obj, exclude=exclude) == {'name': 'Test', 'active': True}
+
 
 class TestJsonDumpsDataclass:
     '''Test cases for json_dumps_dataclass function'''
@@ -127,6 +169,13 @@ class TestJsonDumpsDataclass:
         parsed = json.loads(result)
         assert 'email' not in parsed
 
+    def test_json_dump_matches_stdlib(self) -> None:
+        '''Test output is exactly json.dumps, including ASCII escaping and big ints'''
+        obj = SampleDataclass(name='Zoë', age=2**70)
+
+        assert json_dumps_dataclass(obj) == json.dumps(dump_dataclass(obj), indent=2)
+        assert '\\u00eb' in json_dumps_dataclass(obj)
+
 
 class TestIterDataclass:
     '''Test cases for iter_dataclass function'''
@@ -164,3 +213,50 @@ class TestIterDataclass:
         assert items[0] == ('name', 'Test Person')
         assert items[1][0] == 'address'
         assert isinstance(items[1][1], Address)
+
+    def test_single_field_and_slots(self) -> None:
+        '''Test single-field and slotted dataclasses yield tuples of pairs'''
+        @dataclass(slots=True)
+        class Single:
+            value: int
+
+        @dataclass(slots=True)
+        class Pair:
+            left: int
+            right: int
+
+        assert list(iter_dataclass(Single(value=1))) == [('value', 1)]
+        assert list(iter_dataclass(Pair(left=1, right=2))) == [('left', 1), ('right', 2)]
+        assert dump_dataclass(Single(value=1)) == {'value': 1}
+
+    def test_unset_slot_reads_as_none(self) -> None:
+        '''Test an unset init=False slot yields None instead of raising'''
+        @dataclass(slots=True)
+        class Partial:
+            a: int
+            b: int = field(init=False)
+
+        @dataclass(slots=True)
+        class OnlyUnset:
+            b: int = field(init=False)
+
+        assert list(iter_dataclass(Partial(a=1))) == [('a', 1), ('b', None)]
+        assert list(iter_dataclass_dict(Partial(a=1))) == [('a', 1), ('b', None)]
+        assert list(iter_dataclass_dict(Partial(a=1), exclude_none=True)) == [('a', 1)]
+        assert list(iter_dataclass(OnlyUnset())) == [('b', None)]
+
+    def test_dataclass_type_yields_defaults(self) -> None:
+        '''Test passing the dataclass type itself yields its field defaults'''
+        @dataclass
+        class Defaults:
+            x: int = 3
+            y: str = 'q'
+
+        assert list(iter_dataclass(Defaults)) == [('x', 3), ('y', 'q')]
+        assert list(iter_dataclass_dict(Defaults, exclude={'y'})) == [('x', 3)]
+        assert list(iter_dataclass(SampleDataclass)) == [
+            ('name', None),
+            ('age', None),
+            ('email', None),
+            ('active', True)
+        ]
@@ -1,7 +1,7 @@
 '''Tests for action_toolkit.internals.exception module'''
 
 import pytest
-from action_toolkit.corelib.exception import BaseActionError
+from action_toolkit.corelib.exception import EXC_FORMAT, BaseActionError
 
 
 class TestBaseActionError:
@@ -33,6 +33,12 @@ class TestBaseActionError:
         expected = "PyActionToolkit.BaseActionError: Custom message.\n<cause=N/A>"
         assert error.message == expected
 
+    def test_exc_format_matches_message(self):
+        '''Test the public EXC_FORMAT still describes the message'''
+        error = BaseActionError("Custom message", cause=KeyError())
+        expected = EXC_FORMAT.format(name='BaseActionError', message='Custom message', cause='KeyError')
+        assert error.message == expected
+
     def test_exception_can_be_caught(self):
         '''Test that the exception can be caught properly'''
         with pytest.raises(BaseActionError) as exc_info:
@@ -1,7 +1,15 @@
 '''Tests for action_toolkit.exec module'''
 
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import io
+import os
+import signal
 import subprocess
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -18,6 +26,16 @@ from action_toolkit.exec import (
     ExecListeners,
     ExecResult
 )
+from action_toolkit.exec.main import _take_lines
+
+
+def _popen_mock(returncode: int = 0, stdout: str = '', stderr: str = '') -> Mock:
+    '''Builds a Popen stand-in whose pipes yield the given output'''
+    process = Mock(returncode=returncode)
+    process.stdout = io.StringIO(stdout)
+    process.stderr = io.StringIO(stderr)
+    process.wait.return_value = returncode
+    return process
 
 
 class TestExecResult:
@@ -41,6 +59,14 @@ class TestExecResult:
         )
         assert failure_result.success is False
 
+    def test_result_is_frozen(self):
+        '''Test results are immutable slotted instances'''
+        result = ExecResult(exit_code=0, stdout='', stderr='', command='test')
+
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.exit_code = 1  # type: ignore[misc]
+
 
 class TestExecOptions:
     '''Test cases for ExecOptions class'''
@@ -57,6 +83,13 @@ class TestExecOptions:
         assert options.ignore_return_code is False
         assert options.fail_on_stderr is False
 
+    def test_options_are_frozen(self):
+        '''Test options cannot be mutated since defaults are shared'''
+        options = ExecOptions()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            options.silent = True  # type: ignore[misc]
+
     def test_custom_options(self):
         '''Test custom option values'''
 
@@ -89,6 +122,7 @@ class TestExecListeners:
         assert listeners.stdout is None
         assert listeners.stderr is None
         assert listeners.debug is None
+        assert listeners.raw is False
 
     def test_custom_listeners(self):
         '''Test custom listener functions'''
@@ -110,10 +144,10 @@ class TestExecListeners:
 class TestExec:
     '''Test cases for exec function'''
 
-    @patch('subprocess.run')
-    def test_successful_execution(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_successful_execution(self, mock_popen):
         '''Test successful command execution'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='output line',
             stderr=''
@@ -127,12 +161,12 @@ class TestExec:
         assert result.stderr == ''
         assert result.command == 'echo hello'
 
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_failed_execution(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_failed_execution(self, mock_popen):
         '''Test failed command execution'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=1,
             stdout='',
             stderr='error message'
@@ -146,10 +180,10 @@ class TestExec:
         assert error.command == 'false'
         assert 'failed' in str(error)
 
-    @patch('subprocess.run')
-    def test_ignore_return_code(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_ignore_return_code(self, mock_popen):
         '''Test ignoring non-zero return codes'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=1,
             stdout='',
             stderr='error'
@@ -161,10 +195,10 @@ class TestExec:
         assert result.success is False
         assert result.exit_code == 1
 
-    @patch('subprocess.run')
-    def test_fail_on_stderr(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_fail_on_stderr(self, mock_popen):
         '''Test failing when stderr has content'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='output',
             stderr='warning message'
@@ -193,10 +227,10 @@ class TestExec:
         call_args = mock_run.call_args
         assert call_args[1]['input'] == 'test input'
 
-    @patch('subprocess.run')
-    def test_with_cwd(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_with_cwd(self, mock_popen):
         '''Test command with working directory'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='/tmp',
             stderr=''
@@ -205,13 +239,13 @@ class TestExec:
         options = ExecOptions(cwd='/tmp')
         exec('pwd', options=options)
 
-        call_args = mock_run.call_args
+        call_args = mock_popen.call_args
         assert call_args[1]['cwd'] == Path('/tmp')
 
-    @patch('subprocess.run')
-    def test_with_env(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_with_env(self, mock_popen):
         '''Test command with environment variables'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='value',
             stderr=''
@@ -220,15 +254,27 @@ class TestExec:
         options = ExecOptions(env={'CUSTOM_VAR': 'value'})
         exec('echo', ['$CUSTOM_VAR'], options=options)
 
-        call_args = mock_run.call_args
+        call_args = mock_popen.call_args
         env = call_args[1]['env']
         assert 'CUSTOM_VAR' in env
         assert env['CUSTOM_VAR'] == 'value'
+        assert 'PATH' in env
 
-    @patch('subprocess.run')
-    def test_timeout_error(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_inherits_env_without_overrides(self, mock_popen):
+        '''Test the child inherits the environment when no env is given'''
+        mock_popen.return_value = _popen_mock()
+
+        exec('command')
+
+        assert mock_popen.call_args[1]['env'] is None
+
+    @patch('subprocess.Popen')
+    def test_timeout_error(self, mock_popen):
         '''Test command timeout'''
-        mock_run.side_effect = subprocess.TimeoutExpired(['sleep', '10'], 1)
+        process = _popen_mock()
+        process.wait.side_effect = [subprocess.TimeoutExpired(['sleep', '10'], 1), -9]
+        mock_popen.return_value = process
 
         options = ExecOptions(timeout=1.0)
 
@@ -236,21 +282,22 @@ class TestExec:
             exec('sleep', ['10'], options=options)
 
         assert 'timed out' in str(exc_info.value)
+        process.kill.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_file_not_found(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_file_not_found(self, mock_popen):
         '''Test command not found'''
-        mock_run.side_effect = FileNotFoundError()
+        mock_popen.side_effect = FileNotFoundError()
 
         with pytest.raises(ExecError) as exc_info:
             exec('nonexistent-command')
 
         assert 'not found' in str(exc_info.value)
 
-    @patch('subprocess.run')
-    def test_listeners(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_listeners(self, mock_popen):
         '''Test output listeners'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='line1\nline2',
             stderr='error1\nerror2'
@@ -269,6 +316,31 @@ class TestExec:
         assert stdout_lines == ['line1', 'line2']
         assert stderr_lines == ['error1', 'error2']
 
+    @patch('subprocess.Popen')
+    def test_raw_listeners(self, mock_popen):
+        '''Test raw listeners receive undecoded lines with their endings'''
+        process = _popen_mock(returncode=0)
+        process.stdout = io.BytesIO('line1\nlíne2'.encode())
+        process.stderr = io.BytesIO(b'error1\n')
+        mock_popen.return_value = process
+
+        stdout_lines = []
+        stderr_lines = []
+
+        listeners = ExecListeners(
+            stdout=stdout_lines.append,
+            stderr=stderr_lines.append,
+            raw=True
+        )
+
+        result = exec('command', listeners=listeners)
+
+        assert mock_popen.call_args[1]['text'] is False
+        assert stdout_lines == [b'line1\n', 'líne2'.encode()]
+        assert stderr_lines == [b'error1\n']
+        assert result.stdout == 'line1\nlíne2'
+        assert result.stderr == 'error1\n'
+
 
 class TestExecAsync:
     '''Test cases for exec_async function'''
@@ -299,14 +371,119 @@ class TestExecAsync:
 
         assert 'timed out' in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_async_listeners_long_lines(self):
+        '''Test async listeners get whole lines, including ones past the read size'''
+        script = "import sys; print('x' * 200000); print('tail'); sys.stderr.write('err')"
+        stdout_lines = []
+        stderr_lines = []
+
+        listeners = ExecListeners(stdout=stdout_lines.append, stderr=stderr_lines.append)
+        result = await exec_async(
+            sys.executable,
+            ['-c', script],
+            options=ExecOptions(silent=True),
+            listeners=listeners
+        )
+
+        assert stdout_lines == ['x' * 200000, 'tail']
+        assert stderr_lines == ['err']
+        assert result.stdout.splitlines() == stdout_lines
+
+    @pytest.mark.asyncio
+    async def test_async_listener_error_stops_process(self):
+        '''Test a failing async listener propagates and stops the child'''
+        script = "import threading; print('a', flush=True); threading.Event().wait()"
+        processes = []
+        real_create = asyncio.create_subprocess_exec
+
+        async def spawn(*args, **kwargs):
+            process = await real_create(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        def listener(line):
+            raise ValueError(f'bad line {line}')
+
+        started = time.monotonic()
+        with patch('asyncio.create_subprocess_exec', side_effect=spawn):
+            with pytest.raises(ValueError, match='bad line a'):
+                await exec_async(
+                    sys.executable,
+                    ['-c', script],
+                    options=ExecOptions(silent=True),
+                    listeners=ExecListeners(stdout=listener)
+                )
+
+        assert time.monotonic() - started < 30
+        assert processes[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_async_line_breaks_match_sync(self):
+        '''Test async listeners split on the same line breaks as exec'''
+        script = "import sys; sys.stdout.buffer.write(b'a\\rb\\nc\\r\\nd\\r')"
+        options = ExecOptions(silent=True)
+        sync_lines = []
+        async_lines = []
+
+        exec(sys.executable, ['-c', script], options=options, listeners=ExecListeners(stdout=sync_lines.append))
+        await exec_async(
+            sys.executable,
+            ['-c', script],
+            options=options,
+            listeners=ExecListeners(stdout=async_lines.append)
+        )
+
+        assert async_lines == sync_lines == ['a', 'b', 'c', 'd']
+
+    def test_take_lines_across_reads(self):
+        '''Test a \\r\\n split over two reads is one line break'''
+        buffer = bytearray(b'one\r')
+        lines, scan_from = _take_lines(buffer, 0, raw=False)
+        assert lines == []
+        assert buffer == b'one\r'
+
+        buffer += b'\ntwo'
+        lines, scan_from = _take_lines(buffer, scan_from, raw=False)
+        assert lines == [b'one']
+        assert buffer == b'two'
+
+        raw_buffer = bytearray(b'a\r\nb')
+        assert _take_lines(raw_buffer, 0, raw=True)[0] == [b'a\r\n']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('raw', [False, True])
+    async def test_invalid_utf8_decoded_alike(self, raw):
+        '''Test sync and async results decode invalid bytes the same way'''
+        script = "import sys; sys.stdout.buffer.write(b'ok\\xff\\n')"
+        options = ExecOptions(silent=True)
+        listeners = ExecListeners(raw=raw)
+
+        sync_result = exec(sys.executable, ['-c', script], options=options, listeners=listeners)
+        async_result = await exec_async(sys.executable, ['-c', script], options=options, listeners=listeners)
+
+        assert sync_result.stdout == async_result.stdout == 'ok\ufffd\n'
+
+    @pytest.mark.asyncio
+    async def test_async_with_input(self):
+        '''Test async command reads the provided input'''
+        options = ExecOptions(input='line1\nline2\n', silent=True)
+        result = await exec_async(
+            sys.executable,
+            ['-c', 'import sys; sys.stdout.write(sys.stdin.read().upper())'],
+            options=options
+        )
+
+        assert result.stdout == 'LINE1\nLINE2\n'
+
 
 class TestExecContext:
     '''Test cases for exec_context function'''
 
-    @patch('subprocess.run')
-    def test_exec_context(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_exec_context(self, mock_popen):
         '''Test execution context manager'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='test',
             stderr=''
@@ -318,7 +495,7 @@ class TestExecContext:
 
             exec('command', options=ctx)
 
-        call_args = mock_run.call_args
+        call_args = mock_popen.call_args
         assert call_args[1]['cwd'] == Path('/tmp')
 
     @pytest.mark.asyncio
@@ -334,10 +511,10 @@ class TestExecContext:
 class TestGetExecOutput:
     '''Test cases for get_exec_output function'''
 
-    @patch('subprocess.run')
-    def test_get_output(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_get_output(self, mock_popen):
         '''Test getting command output'''
-        mock_run.return_value = Mock(
+        mock_popen.return_value = _popen_mock(
             returncode=0,
             stdout='expected output',
             stderr=''
@@ -388,6 +565,83 @@ class TestExecError:
 class TestExecIntegration:
     '''Integration tests using real commands'''
 
+    def test_listener_error_propagates(self):
+        '''Test a listener exception reaches the caller and stops the child right away'''
+        seen = []
+        processes = []
+        real_popen = subprocess.Popen
+
+        def spawn(*args, **kwargs):
+            process = real_popen(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        def listener(line):
+            seen.append(line)
+            raise ValueError(f'bad line {line}')
+
+        script = "import time; print('a', flush=True); print('b', flush=True); time.sleep(60)"
+        listeners = ExecListeners(stdout=listener)
+        options = ExecOptions(silent=True)
+
+        started = time.monotonic()
+        with patch('subprocess.Popen', side_effect=spawn):
+            with pytest.raises(ValueError, match='bad line a'):
+                exec(sys.executable, ['-c', script], options=options, listeners=listeners)
+
+        assert time.monotonic() - started < 30
+        assert processes[0].returncode is not None
+        assert seen == ['a']
+
+    def test_listeners_see_caller_context(self):
+        '''Test listeners run one at a time with the caller's context variables'''
+        request_id = contextvars.ContextVar('request_id')
+        request_id.set('abc')
+        seen = []
+        active = []
+
+        def listener(line):
+            active.append(line)
+            assert len(active) == 1
+            seen.append(request_id.get())
+            time.sleep(0.01)
+            active.remove(line)
+
+        script = (
+            'import sys\n'
+            'for i in range(5):\n'
+            '    print(i, flush=True); print(i, file=sys.stderr, flush=True)'
+        )
+        listeners = ExecListeners(stdout=listener, stderr=listener)
+        options = ExecOptions(silent=True)
+
+        exec(sys.executable, ['-c', script], options=options, listeners=listeners)
+
+        assert seen == ['abc'] * 10
+
+    def test_timeout_covers_inherited_pipes(self):
+        '''Test the timeout still fires when a grandchild keeps the pipes open'''
+        script = (
+            'import subprocess, sys; '
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+            'print(child.pid, flush=True)'
+        )
+        pids = []
+        listeners = ExecListeners(stdout=lambda line: pids.append(int(line)))
+        options = ExecOptions(timeout=1.0, silent=True)
+
+        started = time.monotonic()
+        try:
+            with pytest.raises(ExecError) as exc_info:
+                exec(sys.executable, ['-c', script], options=options, listeners=listeners)
+        finally:
+            for pid in pids:
+                with contextlib.suppress(OSError):
+                    os.kill(pid, signal.SIGTERM)
+
+        assert 'timed out' in str(exc_info.value)
+        assert time.monotonic() - started < 20
+
     def test_python_version(self):
         '''Test getting Python version'''
         result = exec('python', ['--version'])